@@ -30,6 +30,7 @@ PyTorch는 기존의 스트라이드(strides) 구조를 사용함으로써 메
 
 ######################################################################
 # Channels Last 메모리 형식은 오직 4D NCWH Tensors에서만 실행할 수 있습니다.
+# (5D NCDHW 텐서에는 ``torch.channels_last_3d`` 를 사용하며, 아래에서 다시 다룹니다.)
 #
 
 import torch
@@ -44,65 +45,113 @@ N, C, H, W = 10, 3, 32, 32
 ######################################################################
 # 전형적인 PyTorch의 연속적인 텐서(tensor)
 x = torch.empty(N, C, H, W)
-print(x.stride()) # 결과: (3072, 1024, 32, 1)
+assert x.stride() == (3072, 1024, 32, 1)
 
 ######################################################################
 # 변환 연산자
+#
+# 변환은 새 텐서를 할당하고 전체 원소를 복사하므로, 학습 반복문처럼 자주 실행되는 곳(hot path)에서는
+# 피하는 것이 좋습니다. 가능하면 아래의 "Channels Last 방식으로 생성하기" 처럼 처음부터 원하는 형식으로 만드세요.
 x = x.contiguous(memory_format=torch.channels_last)
-print(x.shape) # 결과: (10, 3, 32, 32) 차원 순서는 보존함
-print(x.stride()) # 결과: (3072, 1, 96, 3)
+assert x.shape == (10, 3, 32, 32) # 차원 순서는 보존함
+assert x.stride() == (3072, 1, 96, 3)
 
 ######################################################################
 # 연속적인 형식으로 되돌리기
 x = x.contiguous(memory_format=torch.contiguous_format)
-print(x.stride()) # 결과: (3072, 1024, 32, 1)
+assert x.stride() == (3072, 1024, 32, 1)
 
 ######################################################################
 # 다른 방식
 x = x.to(memory_format=torch.channels_last)
-print(x.stride()) # 결과: (3072, 1, 96, 3)
+assert x.stride() == (3072, 1, 96, 3)
+
+######################################################################
+# 장치 이동과 형식 변환이 함께 필요하다면 하나의 ``to`` 호출로 합치세요.
+# CPU에서 먼저 변환한 뒤 ``cuda()`` 를 호출하면 느린 CPU에서 순서를 바꾸게(permute) 되지만,
+# 한 번에 요청하면 PyTorch가 (대개 복사 후 GPU에서 변환하는) 더 나은 순서를 선택할 수 있습니다.
+if __name__ == "__main__" and torch.cuda.is_available():
+    y = torch.empty(N, C, H, W).to(device="cuda", memory_format=torch.channels_last, non_blocking=True)
+    assert y.stride() == (3072, 1, 96, 3)
 
 ######################################################################
 # 형식(format) 확인
-print(x.is_contiguous(memory_format=torch.channels_last)) # 결과: True
+assert x.is_contiguous(memory_format=torch.channels_last)
 
 ######################################################################
 # Channels Last 방식으로 생성하기
 x = torch.empty(N, C, H, W, memory_format=torch.channels_last)
-print(x.stride()) # 결과: (3072, 1, 96, 3)
+assert x.stride() == (3072, 1, 96, 3)
+
+######################################################################
+# 이미 존재하는 (큰) 텐서를 변환해야 하고 목표 스트라이드를 알고 있다면, ``empty_strided`` 로
+# Channels Last 텐서를 직접 할당한 뒤 ``copy_`` 로 채울 수 있습니다. 형식 변환은 스트라이드로만 표현되고
+# 할당과 복사가 분리되므로, 반복문에서는 미리 할당해 둔 버퍼에 ``copy_`` 만 반복하여 매번의 할당을 피할 수 있습니다.
+src = torch.empty(N, C, H, W)
+nhwc_stride = (C * H * W, 1, C * W, C)
+y = torch.empty_strided((N, C, H, W), nhwc_stride, device=src.device, dtype=src.dtype)
+y.copy_(src)
+assert y.stride() == (3072, 1, 96, 3)
 
 ######################################################################
 # ``clone`` 은 메모리 형식을 보존합니다.
 y = x.clone()
-print(y.stride()) # 결과: (3072, 1, 96, 3)
+assert y.stride() == (3072, 1, 96, 3)
 
 ######################################################################
 # ``to``, ``cuda``, ``float`` ... 등도 메모리 형식을 보존합니다.
-if torch.cuda.is_available():
+if __name__ == "__main__" and torch.cuda.is_available():
     y = x.cuda()
-    print(y.stride()) # 결과: (3072, 1, 96, 3)
+    assert y.stride() == (3072, 1, 96, 3)
 
 ######################################################################
 # ``empty_like``, ``*_like`` 연산자도 메모리 형식을 보존합니다.
 y = torch.empty_like(x)
-print(y.stride()) # 결과: (3072, 1, 96, 3)
+assert y.stride() == (3072, 1, 96, 3)
 
 ######################################################################
 # Pointwise 연산자도 메모리 형식을 보존합니다.
 z = x + y
-print(z.stride()) # 결과: (3072, 1, 96, 3)
+assert z.stride() == (3072, 1, 96, 3)
 
 ######################################################################
 # Conv, Batchnorm 모듈은 Channels Last를 지원합니다. (단, CudNN >=7.6 에서만 동작)
-if torch.backends.cudnn.version() >= 7603:
-    input = torch.randint(1, 10, (2, 8, 4, 4), dtype=torch.float32, device="cuda", requires_grad=True)
-    model = torch.nn.Conv2d(8, 4, 3).cuda().float()
+#
+# Tensor Cores는 FP16/BF16(Ampere 이상에서는 TF32 포함) 연산에서만 사용되므로, FP32 그대로 실행하면
+# Channels Last로 바꾸더라도 Tensor Cores의 이점을 얻지 못합니다. 순전파를 ``torch.autocast`` 로 감싸
+# NHWC Tensor Core 커널이 선택되도록 합니다. 입력 채널과 출력 채널 수도 8의 배수여야 합니다.
+#
+# 이 파일을 모듈로 불러오는(import) 경우에는 아래 예제들이 실행되지 않도록 ``__main__`` 에서만 실행하며,
+# 이 예제의 ``model`` 과 ``input`` 을 사용하는 이후의 예제들도 같은 조건에서만 실행합니다.
+run_cuda_demo = (__name__ == "__main__" and torch.cuda.is_available()
+                 and torch.backends.cudnn.version() >= 7603)
+if run_cuda_demo:
+    # Ampere 이상에서 autocast 밖에 남는 FP32 행렬 곱도 TF32로 실행합니다
+    torch.set_float32_matmul_precision("high")
+
+    # 입력을 처음부터 Channels Last로 생성하여 별도의 할당과 복사를 피합니다
+    input = torch.empty((2, 8, 4, 4), dtype=torch.float32, device="cuda",
+                        memory_format=torch.channels_last).random_(1, 10).requires_grad_()
+    model = torch.nn.Conv2d(8, 8, 3).cuda().float()
 
-    input = input.contiguous(memory_format=torch.channels_last)
     model = model.to(memory_format=torch.channels_last) # 모듈 인자들은 Channels Last로 변환이 필요합니다
 
-    out = model(input)
-    print(out.is_contiguous(memory_format=torch.channels_last)) # 결과: True
+    with torch.autocast(device_type="cuda", dtype=torch.float16):
+        out = model(input)
+    assert out.is_contiguous(memory_format=torch.channels_last)
+
+######################################################################
+# 3D 합성곱(의료 영상, 비디오, VAE 디코더 등)에서는 5D NCDHW 텐서에 ``torch.channels_last_3d`` (NDHWC)를
+# 사용합니다. 사용법은 4D의 경우와 같으며, 입력과 가중치가 모두 ``channels_last_3d`` 여야 합성곱 전후로
+# NCDHW↔NDHWC 변환 커널이 끼어들지 않습니다.
+if run_cuda_demo:
+    input3d = torch.empty((2, 16, 8, 32, 32), dtype=torch.float16, device="cuda",
+                          memory_format=torch.channels_last_3d).normal_()
+    c = torch.nn.Conv3d(16, 128, 3, padding=1).cuda().half()
+    c.weight.data = c.weight.data.to(memory_format=torch.channels_last_3d)
+
+    out = c(input3d)
+    assert out.is_contiguous(memory_format=torch.channels_last_3d)
 
 ######################################################################
 # 성능 향상
@@ -191,6 +240,40 @@ if torch.backends.cudnn.version() >= 7603:
 # ``alexnet``, ``mnasnet0_5``, ``mnasnet0_75``, ``mnasnet1_0``, ``mnasnet1_3``, ``mobilenet_v2``, ``resnet101``, ``resnet152``, ``resnet18``, ``resnet34``, ``resnet50``, ``resnext50_32x4d``, ``shufflenet_v2_x0_5``, ``shufflenet_v2_x1_0``, ``shufflenet_v2_x1_5``, ``shufflenet_v2_x2_0``, ``squeezenet1_0``, ``squeezenet1_1``, ``vgg11``, ``vgg11_bn``, ``vgg13``, ``vgg13_bn``, ``vgg16``, ``vgg16_bn``, ``vgg19``, ``vgg19_bn``, ``wide_resnet101_2``, ``wide_resnet50_2``
 #
 
+######################################################################
+# 단, Channels Last와 FP16을 함께 사용하더라도 모든 합성곱이 Tensor Cores에서 실행되는 것은 아닙니다.
+# 입력 채널(C)과 출력 채널(K) 수가 8의 배수가 아니면 cuDNN은 일반 CUDA 코어 커널로 대체(fall back)하며,
+# 이때는 아무런 경고 없이 성능이 크게 떨어집니다. 또한 ``H == W == 1`` 인 텐서는 NCHW와 NHWC의 스트라이드가
+# 사실상 같아 메모리 형식이 모호해집니다(아래 "해야할 일"의 N1HW/NC11 참고).
+# 다음과 같이 ``nn.Conv2d`` 에 forward pre-hook을 등록하면 이런 경우를 실행 중에 경고로 알 수 있습니다.
+
+import warnings
+
+
+def check_tc_eligible(module, inputs):
+    # 배치 차원이 없는 (C, H, W) 입력도 받을 수 있으므로 채널 수는 모듈에서, 공간 차원은 뒤에서부터 읽습니다.
+    input = inputs[0]
+    if module.in_channels % 8 or module.out_channels % 8:
+        warnings.warn("`{}`: channels ({} -> {}) are not divisible by 8, Tensor Cores will not be used".format(
+            module, module.in_channels, module.out_channels))
+    if input.shape[-2] * input.shape[-1] == 1:
+        warnings.warn("`{}`: input with H == W == 1 has an ambiguous memory format".format(module))
+
+
+def register_tc_check(model):
+    return [m.register_forward_pre_hook(check_tc_eligible)
+            for m in model.modules() if isinstance(m, torch.nn.Conv2d)]
+
+
+# 위의 Conv2d 예제는 채널 수가 8의 배수이므로 경고가 발생하지 않습니다.
+# 확인이 끝나면 반환된 핸들(handle)로 hook을 제거합니다.
+if run_cuda_demo:
+    handles = register_tc_check(model)
+    with torch.autocast(device_type="cuda", dtype=torch.float16):
+        out = model(input)
+    for handle in handles:
+        handle.remove()
+
 ######################################################################
 # 기존 모델들 변환하기
 # --------------------------
@@ -199,12 +282,22 @@ if torch.backends.cudnn.version() >= 7603:
 # 입력(input)의 형식만 맞춰주면 (신경망) 그래프를 통해 바로 전파(propagate)할 수 있습니다.
 #
 
-# 모델을 초기화한(또는 불러온) 이후, 한 번 실행이 필요합니다.
-model = model.to(memory_format=torch.channels_last) # 원하는 모델로 교체하기
+if run_cuda_demo:
+    # 모델을 초기화한(또는 불러온) 이후, 한 번 실행이 필요합니다.
+    model = model.to(memory_format=torch.channels_last) # 원하는 모델로 교체하기
 
-# 모든 입력에 대해서 실행이 필요합니다.
-input = input.to(memory_format=torch.channels_last) # 원하는 입력으로 교체하기
-output = model(input)
+    # 모든 입력에 대해서 실행이 필요합니다.
+    input = input.to(memory_format=torch.channels_last) # 원하는 입력으로 교체하기
+    output = model(input)
+
+######################################################################
+# eager 모드에서는 형식을 유지하지 못하는 연산자가 하나라도 있으면 그 전후로 형식 변환이 추가로 실행됩니다.
+# Channels Last로 변환한 모델을 ``torch.compile`` 로 컴파일하면, Inductor가 인접한 ``permute`` →
+# ``contiguous`` 쌍을 제거하거나 다음 pointwise 연산과 합쳐(fuse) 불필요한 재배치 커널을 줄여줍니다.
+# (메모리 형식 변환은 반드시 컴파일 *이전에* 해야 합니다.)
+if run_cuda_demo and hasattr(torch, "compile"):
+    compiled_model = torch.compile(model)
+    output = compiled_model(input)
 
 #######################################################################
 # 그러나, 모든 연산자들이 Channels Last를 지원하도록 완전히 바뀐 것은 아닙니다(일반적으로는 연속적인 출력을 대신 반환합니다).
@@ -214,72 +307,188 @@ output = model(input)
 # 아래 코드에서, 연산자들의 출력이 입력의 메모리 형식과 일치하지 않으면 예외(exception)를 발생시킵니다.
 #
 #
-def contains_cl(args):
-    for t in args:
-        if isinstance(t, torch.Tensor):
-            if t.is_contiguous(memory_format=torch.channels_last) and not t.is_contiguous():
-                return True
-        elif isinstance(t, list) or isinstance(t, tuple):
-            if contains_cl(list(t)):
-                return True
-    return False
-
-
-def print_inputs(args, indent=''):
-    for t in args:
-        if isinstance(t, torch.Tensor):
-            print(indent, t.stride(), t.shape, t.device, t.dtype)
-        elif isinstance(t, list) or isinstance(t, tuple):
-            print(indent, type(t))
-            print_inputs(list(t), indent=indent + '    ')
-        else:
-            print(indent, t)
-
-
-def check_wrapper(fn):
-    name = fn.__name__
-
-    def check_cl(*args, **kwargs):
-        was_cl = contains_cl(args)
-        try:
-            result = fn(*args, **kwargs)
-        except Exception as e:
-            print("`{}` inputs are:".format(name))
-            print_inputs(args)
-            print('-------------------')
-            raise e
-        failed = False
-        if was_cl:
-            if isinstance(result, torch.Tensor):
-                if result.dim() == 4 and not result.is_contiguous(memory_format=torch.channels_last):
-                    print("`{}` got channels_last input, but output is not channels_last:".format(name),
-                          result.shape, result.stride(), result.device, result.dtype)
-                    failed = True
-        if failed and True:
-            print("`{}` inputs are:".format(name))
-            print_inputs(args)
-            raise Exception(
-                'Operator `{}` lost channels_last property'.format(name))
-        return result
-    return check_cl
-
-
-def attribute(m):
-    for i in dir(m):
-        e = getattr(m, i)
-        exclude_functions = ['is_cuda', 'has_names', 'numel',
-                             'stride', 'Tensor', 'is_contiguous', '__class__']
-        if i not in exclude_functions and not i.startswith('_') and '__call__' in dir(e):
-            try:
-                setattr(m, i, check_wrapper(e))
-            except Exception as e:
-                print(i)
-                print(e)
-
-
-attribute(torch.Tensor)
-attribute(torch.nn.functional)
-attribute(torch)
+import functools
+import threading
+import types
+from contextlib import contextmanager
+
+from torch.overrides import TorchFunctionMode, resolve_name
+from torch.utils._pytree import tree_leaves
+
+
+# 아래 함수들의 ``_cl``, ``_Tensor`` 기본 인자는 정의 시점에 한 번만 평가되므로,
+# 매 호출마다 ``torch.channels_last`` 를 전역 이름과 속성으로 찾는 대신 지역 변수로 읽습니다.
+def is_true_cl(t, dim, _cl=torch.channels_last, _cl3d=torch.channels_last_3d):
+    # 4D(``channels_last``) 또는 5D(``channels_last_3d``) 텐서에 대해서만 호출하며, 호출하는 쪽에서 이미 구한
+    # ``dim`` 을 넘겨받습니다. ``not t.is_contiguous()`` 는 NC11, N1HW 처럼 두 형식 모두에 해당하는 모호한 텐서를 걸러냅니다.
+    return t.is_contiguous(memory_format=_cl if dim == 4 else _cl3d) and not t.is_contiguous()
+
+
+def contains_cl(args, _Tensor=torch.Tensor, _is_cl=is_true_cl):
+    # 재귀 호출이나 ``list(t)`` 복사 없이 스택으로 순회하며, 처음 발견한 channels_last 텐서의 차원 수(4 또는 5)를
+    # 즉시 반환합니다. 찾지 못하면 0을 반환합니다.
+    stack = [args]
+    while stack:
+        for t in stack.pop():
+            if isinstance(t, _Tensor):
+                # 편향(bias), ``running_mean`` 같은 1D 텐서나 스칼라는 형식 검사를 하지 않습니다.
+                dim = t.dim()
+                if 4 <= dim <= 5 and _is_cl(t, dim):
+                    return dim
+            elif isinstance(t, (list, tuple)):
+                stack.append(t)
+    return 0
+
+
+def print_inputs(args):
+    # 중첩된 인자들을 평탄화(flatten)한 뒤 한 번에 출력합니다.
+    print("\n".join(
+        "{} {} {} {}".format(t.stride(), tuple(t.shape), t.device, t.dtype)
+        if isinstance(t, torch.Tensor) else repr(t)
+        for t in tree_leaves(args)))
+
+
+# 메모리 형식과 관계없는 메타데이터 조회 연산자들은 import 시점에 한 번만 모아두고 검사하지 않습니다.
+# (PyTorch 버전에 따라 없는 속성은 건너뜁니다.)
+_EXCLUDED_FUNCS = frozenset(
+    f for f in (getattr(torch.Tensor, name, None)
+                for name in ('has_names', 'numel', 'stride', 'is_contiguous'))
+    if f is not None
+)
+
+# ``torch.nn.functional`` 의 함수들도 다른 연산자와 똑같이 검사합니다. 모드는 ``__torch_function__`` 을 처리하는 동안
+# 스택에서 빠지므로 ``F.normalize`` 같은 함수는 바깥쪽 호출의 출력만 검사되며, 그 안에서 호출되는 ``torch``
+# 연산자들은 (제외 여부와 관계없이) 검사되지 않습니다. 따라서 검사 대상에서 제외하면 그 함수는 전혀 검사되지 않습니다.
+
+
+def should_check(func, _excluded=_EXCLUDED_FUNCS, _getset=types.MethodWrapperType):
+    # ``shape``, ``data``, ``T``, ``mT`` 같은 속성(property) 접근은 디스크립터의 ``__get__``/``__set__``
+    # 으로 전달됩니다. 연산이 아니라 속성 조회이거나 의도적으로 스트라이드를 바꾸는 뷰(view)이므로 검사하지 않습니다.
+    return func not in _excluded and not isinstance(func, _getset)
+
+
+@functools.lru_cache(maxsize=None)
+def op_name(func):
+    return resolve_name(func) or getattr(func, '__name__', str(func))
+
+
+_local = threading.local()
+
+
+@contextmanager
+def no_cl_check():
+    # 현재 스레드에서 잠시 검사를 끕니다. 이미 확인이 끝난 반복문(hot loop)을 감쌀 때 사용합니다.
+    prev = getattr(_local, 'disabled', False)
+    _local.disabled = True
+    try:
+        yield
+    finally:
+        _local.disabled = prev
+
+
+def check_cl(func, args, call,
+             _cl=torch.channels_last, _cl3d=torch.channels_last_3d, _Tensor=torch.Tensor):
+    if getattr(_local, 'disabled', False):
+        return call()
+    cl_dim = contains_cl(args)
+    try:
+        result = call()
+    except Exception:
+        print("`{}` inputs are:".format(op_name(func)))
+        print_inputs(args)
+        print('-------------------')
+        raise
+    # 입력과 차원 수가 같은 출력만 검사합니다. ShuffleNet의 ``channel_shuffle`` 처럼 4D channels_last 텐서를
+    # 5D로 ``view`` 하는 경우는 형식을 잃은 것이 아닙니다.
+    if (cl_dim and isinstance(result, _Tensor) and result.dim() == cl_dim
+            and not result.is_contiguous(memory_format=_cl if cl_dim == 4 else _cl3d)):
+        name = op_name(func)
+        print("`{}` got channels_last input, but output is not channels_last:".format(name),
+              result.shape, result.stride(), result.device, result.dtype)
+        print("`{}` inputs are:".format(name))
+        print_inputs(args)
+        raise RuntimeError('Operator `{}` lost channels_last property'.format(name))
+    return result
+
+
+class CLCheckMode(TorchFunctionMode):
+    def __torch_function__(self, func, types, args=(), kwargs=None):
+        kwargs = kwargs or {}
+        if not should_check(func):
+            return func(*args, **kwargs)
+        return check_cl(func, args, lambda: func(*args, **kwargs))
+
+
+######################################################################
+# ``torch`` 네임스페이스를 직접 고치는(monkey-patching) 대신 ``TorchFunctionMode`` 를 사용하므로,
+# 검사는 ``with`` 블록 안에서만 동작하며 블록을 벗어나면 아무런 흔적도 남지 않습니다.
+# 위에서 이미 Channels Last로 변환한 모델과 입력을 그대로 사용하면 됩니다.
+
+if run_cuda_demo:
+    with CLCheckMode():
+        output = model(input)
+
+######################################################################
+# 모드(mode)는 블록 안의 모든 연산을 가로챕니다. 입력에서 파생된 텐서들만 검사하고 싶다면
+# 텐서 하위 클래스(subclass)를 사용할 수 있습니다. ``__torch_function__`` 은 인자 중에
+# 하위 클래스 텐서가 있을 때에만 (C++ 단에서 걸러진 뒤) 호출되므로, 입력과 무관한 연산들은
+# 파이썬 오버헤드 없이 실행됩니다.
+
+class CLCheckTensor(torch.Tensor):
+    @classmethod
+    def __torch_function__(cls, func, types, args=(), kwargs=None):
+        kwargs = kwargs or {}
+        parent = super().__torch_function__
+        if not should_check(func):
+            return parent(func, types, args, kwargs)
+        # 검사 중에 결과 텐서를 조회할 때 다시 ``__torch_function__`` 이 호출되지 않도록 합니다.
+        with torch._C.DisableTorchFunctionSubclass():
+            return check_cl(func, args, lambda: parent(func, types, args, kwargs))
+
+
+# 입력을 한 번만 감싸주면 출력들도 ``CLCheckTensor`` 로 전파됩니다.
+if run_cuda_demo:
+    output = model(input.as_subclass(CLCheckTensor))
+
+######################################################################
+# 모델을 한 번만 점검하면 되는 경우에는 연산을 가로채지 않고 ``torch.fx`` 로 정적으로 확인할 수도 있습니다.
+# ``symbolic_trace`` 로 얻은 그래프에 ``ShapeProp`` 으로 예제 입력을 한 번 전파하면 각 노드의
+# ``tensor_meta`` 에 출력의 모양과 스트라이드가 기록되므로, 점검이 끝난 뒤의 추론에는 아무런 오버헤드가 없습니다.
+
+from torch.fx.passes.shape_prop import ShapeProp
+
+
+def _meta_is_cl(node):
+    # ``ShapeProp`` 은 ``contiguous_format`` 을 먼저 확인하므로 NC11 같은 모호한 출력을 연속 형식으로 기록합니다.
+    # ``tensor_meta.memory_format`` 대신 기록된 모양과 스트라이드로 메타(meta) 텐서를 만들어
+    # eager 검사와 같은 규칙(``is_true_cl``)을 적용합니다.
+    meta = node.meta.get('tensor_meta')
+    shape = getattr(meta, 'shape', None)
+    if shape is None or len(shape) not in (4, 5):
+        return False
+    t = torch.empty_strided(tuple(shape), meta.stride, dtype=meta.dtype, device="meta")
+    return is_true_cl(t, len(shape))
+
+
+def audit_cl(model, example_input):
+    gm = torch.fx.symbolic_trace(model)
+    fmt = torch.channels_last if example_input.dim() == 4 else torch.channels_last_3d
+    ShapeProp(gm).propagate(example_input.contiguous(memory_format=fmt))
+    lost = []
+    for node in gm.graph.nodes:
+        meta = node.meta.get('tensor_meta')
+        if node.op in ('placeholder', 'get_attr', 'output') or len(getattr(meta, 'shape', ())) not in (4, 5):
+            continue
+        cl_dims = {len(n.meta['tensor_meta'].shape) for n in node.all_input_nodes if _meta_is_cl(n)}
+        if len(meta.shape) in cl_dims and not _meta_is_cl(node):
+            print("`{}` got channels_last input, but output is not channels_last:".format(node.target),
+                  tuple(meta.shape), meta.stride, meta.dtype)
+            lost.append(node)
+    return lost
+
+
+if run_cuda_demo:
+    audit_cl(model, input)
 
 
 ######################################################################